@@ -32,48 +32,57 @@ class BrowserBot:
         self.pdf_handler = PDFHandler(self.manager, self.frame_navigator)
         self.form_handler = FormHandler(self.manager, self.frame_navigator)
     
-    def start_session(self, url):
+    def start_session(self, url, deadline=None):
         """
         Navigate to URL and wait for app to be ready.
         
         Args:
             url: URL to navigate to
+            deadline: Optional Deadline limiting navigation time
         """
-        self.manager.driver.get(url)
-        self.wait_for_app()
+        self.manager.navigate(url, deadline)
+        self.wait_for_app(deadline)
     
-    def wait_for_app(self):
+    def wait_for_app(self, deadline=None):
         """
         Wait for the app to be ready (Squad Health element visible).
         
+        Args:
+            deadline: Optional Deadline limiting the wait
+            
         Returns:
             WebElement if found, None otherwise
+            
+        Raises:
+            DeadlineExceeded: If the job budget runs out while waiting
         """
-        return self.manager.wait_for_element(self.APP_READY_LOCATOR)
+        return self.manager.wait_for_element(self.APP_READY_LOCATOR, deadline=deadline)
     
-    def obtain_pdf(self, timeout=30):
+    def obtain_pdf(self, timeout=30, deadline=None):
         """
         Find Print PDF button, click it, and download the PDF.
         
         Args:
             timeout: Maximum time to wait for download (seconds)
+            deadline: Optional Deadline capping the download time
             
         Returns:
             Path to downloaded PDF file, or None if failed
         """
-        return self.pdf_handler.download_pdf(timeout)
+        return self.pdf_handler.download_pdf(timeout, deadline)
     
-    def fill_form(self, engine):
+    def fill_form(self, engine, deadline=None):
         """
         Find form, fill all fields using engine, and submit.
         
         Args:
             engine: Object with ask(question) method that returns answers
+            deadline: Optional Deadline checked between fields
             
         Returns:
             True if successful, False otherwise
         """
-        return self.form_handler.fill_and_submit(engine)
+        return self.form_handler.fill_and_submit(engine, deadline)
     
     def close(self):
         """Close the browser and clean up resources."""
@@ -1,6 +1,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import NoSuchElementException
+from deadline import DeadlineExceeded
 
 
 class FormHandler:
@@ -18,36 +19,44 @@ class FormHandler:
         self.driver = browser_manager.driver
         self.frame_navigator = frame_navigator
     
-    def fill_and_submit(self, engine):
+    def fill_and_submit(self, engine, deadline=None):
         """
         Find form, fill all fields using the provided engine, and submit.
         
         Args:
             engine: Object with an ask(question) method that returns answers
+            deadline: Optional Deadline checked before each field and submit
             
         Returns:
             True if form was submitted successfully, False otherwise
+            
+        Raises:
+            DeadlineExceeded: If the job budget runs out
         """
         form = self.frame_navigator.find_form_in_frames()
         
         if form is None:
             return False
         
-        if not self._fill_form_fields(form, engine):
+        if not self._fill_form_fields(form, engine, deadline):
             return False
         
+        if deadline is not None:
+            deadline.check("form submit")
+        
         if not self._submit_form(form):
             return False
         
         return True
     
-    def _fill_form_fields(self, form, engine):
+    def _fill_form_fields(self, form, engine, deadline=None):
         """
         Fill all fields in the form using the provided engine.
         
         Args:
             form: WebElement representing the form
             engine: Object with ask(question) method
+            deadline: Optional Deadline checked before each field
             
         Returns:
             True if all fields were processed, False if error occurred
@@ -56,6 +65,9 @@ class FormHandler:
         
         while True:
             try:
+                if deadline is not None:
+                    deadline.check("form filling")
+                
                 # Find all field containers
                 field_divs = set(form.find_elements(By.CSS_SELECTOR, "div.flex.flex-col"))
                 field_divs -= answered
@@ -70,6 +82,8 @@ class FormHandler:
                 if not self._process_field(field_div, engine):
                     pass  # Continue to next field
                     
+            except DeadlineExceeded:
+                raise
             except Exception:
                 return False
         
@@ -100,6 +114,8 @@ class FormHandler:
             # Fill the field based on its type
             return self._fill_field(answer_field, response)
             
+        except DeadlineExceeded:
+            raise
         except (NoSuchElementException, Exception):
             return False
     
@@ -4,6 +4,8 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from deadline import DeadlineExceeded
 
 
 class BrowserManager:
@@ -64,21 +66,58 @@ class BrowserManager:
         
         return driver
     
-    def wait_for_element(self, locator, timeout=None):
+    def navigate(self, url, deadline=None):
+        """
+        Load a URL, limiting the page load to the remaining job budget.
+        
+        Args:
+            url: URL to navigate to
+            deadline: Optional Deadline capping the page load time
+            
+        Raises:
+            DeadlineExceeded: If the job budget runs out while loading
+        """
+        if deadline is None:
+            self.driver.get(url)
+            return
+        
+        previous_timeout = self.driver.timeouts.page_load
+        self.driver.set_page_load_timeout(
+            deadline.timeout(self.timeout, "navigation")
+        )
+        try:
+            self.driver.get(url)
+        except TimeoutException as e:
+            if deadline.expired():
+                raise DeadlineExceeded("navigation") from e
+            raise
+        finally:
+            self.driver.set_page_load_timeout(previous_timeout)
+    
+    def wait_for_element(self, locator, timeout=None, deadline=None):
         """
         Wait for an element to be visible.
         
         Args:
             locator: Tuple of (By, selector_string)
             timeout: Optional custom timeout
+            deadline: Optional Deadline capping the timeout
             
         Returns:
             WebElement if found, None otherwise
+            
+        Raises:
+            DeadlineExceeded: If the job budget runs out while waiting
         """
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
+        timeout = timeout or self.timeout
+        if deadline is not None:
+            timeout = deadline.timeout(timeout, "wait for element")
+        wait = WebDriverWait(self.driver, timeout)
         try:
             return wait.until(EC.visibility_of_element_located(locator))
-        except Exception:
+        except Exception as e:
+            if deadline is not None and deadline.expired():
+                raise DeadlineExceeded("wait for element") from e
             return None
     
     def close(self):
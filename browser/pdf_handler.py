@@ -1,6 +1,7 @@
 import os
 import time
 from selenium.webdriver.common.by import By
+from deadline import DeadlineExceeded
 
 
 class PDFHandler:
@@ -22,37 +23,55 @@ class PDFHandler:
         self.download_dir = browser_manager.download_dir
         self.frame_navigator = frame_navigator
     
-    def download_pdf(self, timeout=DEFAULT_DOWNLOAD_TIMEOUT):
+    def download_pdf(self, timeout=DEFAULT_DOWNLOAD_TIMEOUT, deadline=None):
         """
         Find the Print PDF button, click it, and wait for download to complete.
         
         Args:
             timeout: Maximum time to wait for download (seconds)
+            deadline: Optional Deadline capping the time spent on the download
             
         Returns:
             Path to downloaded PDF file, or None if download failed
+            
+        Raises:
+            DeadlineExceeded: If the job budget runs out
         """
-        button = self._find_print_button()
+        button = self._find_print_button(deadline=deadline)
         
         if button is None:
+            if deadline is not None and deadline.expired():
+                raise DeadlineExceeded("find print button")
             return None
         
         button.click()
         
-        return self._wait_for_download(timeout)
+        if deadline is not None:
+            timeout = deadline.timeout(timeout, "download")
+        
+        pdf_path = self._wait_for_download(timeout)
+        
+        if pdf_path is None and deadline is not None and deadline.expired():
+            raise DeadlineExceeded("download")
+        
+        return pdf_path
     
-    def _find_print_button(self, max_attempts=10, retry_delay=1):
+    def _find_print_button(self, max_attempts=10, retry_delay=1, deadline=None):
         """
         Find the Print PDF button, retrying if necessary.
         
         Args:
             max_attempts: Maximum number of attempts to find button
             retry_delay: Delay between retry attempts (seconds)
+            deadline: Optional Deadline checked before each attempt
             
         Returns:
             WebElement (button) if found, None otherwise
         """
         for attempt in range(max_attempts):
+            if deadline is not None:
+                deadline.check("find print button")
+            
             button = self.frame_navigator.find_element_in_frames(
                 By.XPATH,
                 "//button[normalize-space()='Print PDF']"
@@ -62,7 +81,10 @@ class PDFHandler:
                 return button
             
             if attempt < max_attempts - 1:
-                time.sleep(retry_delay)
+                delay = retry_delay
+                if deadline is not None:
+                    delay = deadline.timeout(retry_delay, "find print button")
+                time.sleep(delay)
         
         return None
     
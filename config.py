@@ -1,3 +1,6 @@
 URL = "https://staging.squadhealth.ai/interview"
 
+# total time budget for one job across all stages (seconds)
+JOB_TIMEOUT = 180
+
 # could move other stuff here if desired, such as download_dir, gpt model, etc. 
\ No newline at end of file
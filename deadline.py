@@ -0,0 +1,134 @@
+import time
+from contextlib import contextmanager
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a job runs out of its time budget."""
+
+    def __init__(self, stage=None):
+        self.stage = stage
+        message = "Job deadline exceeded"
+        if stage:
+            message += f" during {stage}"
+        super().__init__(message)
+
+
+class Deadline:
+    """
+    Time budget for a single job, shared by every pipeline stage.
+
+    Each stage asks for its remaining budget instead of using a fixed
+    timeout, so the job as a whole never runs longer than the budget.
+    """
+
+    def __init__(self, budget):
+        """
+        Initialize the deadline.
+
+        Args:
+            budget: Total time allowed for the job (seconds)
+        """
+        self.budget = budget
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + budget
+        self.stage_times = {}
+        self.stage_parents = {}
+        self._active_stages = []
+
+    def remaining(self):
+        """Return the remaining budget in seconds (never negative)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def elapsed(self):
+        """Return the time spent since the deadline was created (seconds)."""
+        return time.monotonic() - self.started_at
+
+    def expired(self):
+        """Return True if the budget has been used up."""
+        return self.remaining() <= 0
+
+    def check(self, stage=None):
+        """
+        Fail fast if the budget has been used up.
+
+        Args:
+            stage: Optional stage name included in the error
+
+        Raises:
+            DeadlineExceeded: If no budget remains
+        """
+        if self.expired():
+            raise DeadlineExceeded(stage)
+
+    def timeout(self, default=None, stage=None):
+        """
+        Return the timeout a stage may use: its default capped by the
+        remaining budget.
+
+        Args:
+            default: The stage's own timeout (seconds), or None for no cap
+            stage: Optional stage name included in the error
+
+        Returns:
+            Timeout in seconds
+
+        Raises:
+            DeadlineExceeded: If no budget remains
+        """
+        self.check(stage)
+        remaining = self.remaining()
+        if default is None:
+            return remaining
+        return min(default, remaining)
+
+    @contextmanager
+    def stage(self, name):
+        """
+        Context manager that records how much budget a stage consumed.
+
+        A stage started inside another stage is recorded as a sub-stage of
+        it, so its time is not counted twice in the report.
+
+        Args:
+            name: Stage name used in the report
+
+        Raises:
+            DeadlineExceeded: If no budget remains when the stage starts
+        """
+        self.check(name)
+        if self._active_stages:
+            self.stage_parents.setdefault(name, self._active_stages[-1])
+        self._active_stages.append(name)
+        start = time.monotonic()
+        try:
+            yield self
+        finally:
+            self._active_stages.pop()
+            spent = time.monotonic() - start
+            self.stage_times[name] = self.stage_times.get(name, 0.0) + spent
+
+    def report(self):
+        """
+        Summarize per-stage budget consumption.
+
+        Top-level stages do not overlap and add up to at most the total;
+        sub-stages are indented under the stage that contains them.
+
+        Returns:
+            Multi-line string with seconds spent per stage and overall
+        """
+        lines = []
+        self._report_stages(None, 0, lines)
+        lines.append(f"total: {self.elapsed():.2f}s of {self.budget:.2f}s budget")
+        return "\n".join(lines)
+
+    def _report_stages(self, parent, depth, lines):
+        """Append report lines for the stages directly under parent."""
+        for name, spent in self.stage_times.items():
+            if self.stage_parents.get(name) != parent:
+                continue
+            line = f"{'  ' * depth}{name}: {spent:.2f}s"
+            if parent is not None:
+                line += f" (part of {parent})"
+            lines.append(line)
+            self._report_stages(name, depth + 1, lines)
@@ -1,28 +1,45 @@
-from browser import BrowserBot 
+from browser import BrowserBot
 from pdf_llm_engine import PdfLLMEngine
 from pdf_processor import extract_text_from_pdf
-from config import URL
+from deadline import Deadline, DeadlineExceeded
+from config import URL, JOB_TIMEOUT
 
 
 def main():
-    bot = BrowserBot()
+    deadline = Deadline(JOB_TIMEOUT)
+    bot = None
+    engine = None
     try:
-        bot.start_session(URL)           # navigate + wait for app
-        pdf_path = bot.obtain_pdf()      # click Print PDF + wait_for_new_pdf
-        
+        with deadline.stage("browser startup"):
+            bot = BrowserBot()
+
+        with deadline.stage("navigation"):
+            bot.start_session(URL, deadline)           # navigate + wait for app
+
+        with deadline.stage("download"):
+            pdf_path = bot.obtain_pdf(deadline=deadline)  # click Print PDF + wait_for_new_pdf
+
         if not pdf_path:
             print("Failed to download PDF")
             return
-        
-        text = extract_text_from_pdf(pdf_path)
 
-        engine = PdfLLMEngine()
+        with deadline.stage("ocr"):
+            text = extract_text_from_pdf(pdf_path, deadline=deadline)
+
+        engine = PdfLLMEngine(deadline=deadline, stream=True)
         engine.set_document(text)
 
-        bot.fill_form(engine)            # answer questions + submit
+        with deadline.stage("form"):
+            bot.fill_form(engine, deadline)            # answer questions + submit
+    except DeadlineExceeded as e:
+        print(e)
     finally:
-        bot.close()
+        if bot is not None:
+            bot.close()
+        print(deadline.report())
+        if engine is not None:
+            print(engine.stats_report())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -1,9 +1,64 @@
 import os
+import math
+import time
+import importlib.util
+import httpx
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import OpenAI, APITimeoutError, APIConnectionError
+from deadline import DeadlineExceeded
+
+# Connection pool sized for the worker's concurrent callers
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY = 60  # seconds
+CONNECT_TIMEOUT = 5  # seconds
+READ_TIMEOUT = 60  # seconds
+
+
+def create_client(max_connections=MAX_CONNECTIONS,
+                  max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                  keepalive_expiry=KEEPALIVE_EXPIRY,
+                  connect_timeout=CONNECT_TIMEOUT,
+                  read_timeout=READ_TIMEOUT,
+                  http2=None):
+    """
+    Create an OpenAI client backed by a pooled keep-alive HTTP transport.
+    
+    Args:
+        max_connections: Maximum number of open connections
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry: Time an idle connection is kept open (seconds)
+        connect_timeout: Timeout for establishing a connection (seconds)
+        read_timeout: Timeout for reading response data (seconds)
+        http2: Use HTTP/2; defaults to True when the h2 package is installed
+        
+    Returns:
+        OpenAI client instance
+    """
+    if http2 is None:
+        http2 = importlib.util.find_spec("h2") is not None
+
+    timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+    http_client = httpx.Client(
+        http2=http2,
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+    return OpenAI(http_client=http_client, timeout=timeout)
+
+
+def _percentile(sorted_values, percent):
+    """Return the nearest-rank percentile of an already sorted list."""
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
 
 load_dotenv()
-client = OpenAI()
+client = create_client()
 
 SYSTEM_PROMPT = """
 You are a helpful assistant for clinicians and operations staff.
@@ -19,9 +74,22 @@ Do not use acronyms by themselves. Write what it stands for and the acronym in p
 class PdfLLMEngine:
     """Uses GPT-5.1 to answer questions about PDF content."""
     
-    def __init__(self, model="gpt-5.1"):
+    def __init__(self, model="gpt-5.1", deadline=None, llm_client=None, stream=False):
+        """
+        Initialize the engine.
+        
+        Args:
+            model: OpenAI model name
+            deadline: Optional Deadline capping the time of each call
+            llm_client: OpenAI client to use (defaults to the shared pooled client)
+            stream: Stream responses, recording time-to-first-token per call
+        """
         self.model = model
+        self.deadline = deadline
+        self.client = llm_client or client
+        self.stream = stream
         self.document_text = ""
+        self.call_stats = []
 
     def set_document(self, text):
         """Set the PDF text content for answering questions."""
@@ -35,7 +103,10 @@ class PdfLLMEngine:
             question: Question string
             
         Returns:
-            Answer string from the LLM
+            Answer string from the LLM (timings are appended to call_stats)
+            
+        Raises:
+            DeadlineExceeded: If the job budget runs out
         """
         if not self.document_text:
             raise ValueError("No document text has been set yet")
@@ -62,11 +133,163 @@ class PdfLLMEngine:
             },
         ]
 
-        response = client.responses.create(
+        if self.deadline is None:
+            return self._request_answer(input_items)
+
+        with self.deadline.stage("llm"):
+            remaining = self.deadline.timeout(stage="llm")
+            timeout = self._capped_timeout(remaining)
+            # Retries would run past the budget, so each call gets one attempt
+            llm_client = self.client.with_options(max_retries=0, timeout=timeout)
+            try:
+                return self._request_answer(input_items, llm_client)
+            except APITimeoutError as e:
+                if self.deadline.expired():
+                    raise DeadlineExceeded("llm") from e
+                raise
+
+    def stats_report(self):
+        """
+        Summarize per-call LLM timings.
+        
+        Returns:
+            Multi-line string with the call count and p50/p95/max of
+            time-to-first-token and total latency
+        """
+        lines = [f"llm calls: {len(self.call_stats)}"]
+        for key, label in (("ttft", "time to first token"), ("latency", "latency")):
+            values = sorted(
+                stat[key] for stat in self.call_stats if stat[key] is not None
+            )
+            if not values:
+                continue
+            lines.append(
+                f"{label}: p50 {_percentile(values, 50):.2f}s, "
+                f"p95 {_percentile(values, 95):.2f}s, max {values[-1]:.2f}s"
+            )
+        return "\n".join(lines)
+
+    def _capped_timeout(self, remaining):
+        """
+        Clamp the client's own read and connect timeouts to the remaining budget.
+        
+        Args:
+            remaining: Remaining job budget (seconds)
+            
+        Returns:
+            httpx.Timeout for a single call
+        """
+        timeout = self.client.timeout
+        if isinstance(timeout, httpx.Timeout):
+            read, connect = timeout.read, timeout.connect
+        elif isinstance(timeout, (int, float)):
+            read = connect = timeout
+        else:
+            read = connect = None
+
+        return httpx.Timeout(
+            remaining if read is None else min(read, remaining),
+            connect=remaining if connect is None else min(connect, remaining),
+        )
+
+    def _request_answer(self, input_items, llm_client=None):
+        """
+        Send the request and record its time-to-first-token and total latency.
+        
+        Args:
+            input_items: Responses API input items
+            llm_client: Optional client overriding self.client for this call
+            
+        Returns:
+            Answer string from the LLM
+        """
+        llm_client = llm_client or self.client
+        start = time.monotonic()
+
+        if self.stream:
+            answer, first_token_at = self._stream_answer(input_items, llm_client)
+        else:
+            response = llm_client.responses.create(
+                model=self.model,
+                input=input_items,
+                reasoning={"effort": "low"},
+                text={"verbosity": "medium"},
+            )
+            answer = response.output_text
+            # Without streaming the first token arrives with the full body
+            first_token_at = time.monotonic()
+
+        end = time.monotonic()
+        self.call_stats.append({
+            "stream": self.stream,
+            "ttft": first_token_at - start if first_token_at else None,
+            "latency": end - start,
+        })
+        return answer
+
+    def _stream_answer(self, input_items, llm_client):
+        """
+        Stream the response, recording when the first text delta arrives.
+        
+        The stream is read to its end (the few events after the completed
+        text) so that an HTTP/1.1 connection goes back to the pool instead
+        of being closed.
+        
+        Args:
+            input_items: Responses API input items
+            llm_client: OpenAI client to send the request with
+            
+        Returns:
+            Tuple of (answer string, monotonic time of the first text delta)
+            
+        Raises:
+            DeadlineExceeded: If the job budget runs out while streaming
+            APITimeoutError: If reading the stream times out
+            APIConnectionError: If the connection fails while streaming
+        """
+        stream = llm_client.responses.create(
             model=self.model,
             input=input_items,
             reasoning={"effort": "low"},
             text={"verbosity": "medium"},
+            stream=True,
         )
 
-        return response.output_text
\ No newline at end of file
+        deltas = []
+        answer = None
+        first_token_at = None
+        try:
+            for event in stream:
+                # The read timeout resets on every event, so check the budget
+                # here; once the answer is in, only draining reads are left
+                if (answer is None and self.deadline is not None
+                        and self.deadline.expired()):
+                    raise DeadlineExceeded("llm")
+
+                if event.type == "response.output_text.delta":
+                    if first_token_at is None:
+                        first_token_at = time.monotonic()
+                    deltas.append(event.delta)
+                elif event.type == "response.output_text.done":
+                    answer = event.text
+                elif event.type == "response.completed" and answer is None:
+                    answer = event.response.output_text
+        except httpx.HTTPError as e:
+            # The SDK only wraps httpx errors raised while sending the request,
+            # so errors while reading the stream are converted here
+            if answer is not None:
+                # Only the draining reads failed; the answer is complete
+                return answer, first_token_at
+            if self.deadline is not None and self.deadline.expired():
+                raise DeadlineExceeded("llm") from e
+            if isinstance(e, httpx.TimeoutException):
+                raise APITimeoutError(request=e.request) from e
+            raise APIConnectionError(request=e.request) from e
+        finally:
+            # Closing a fully read stream keeps the connection; closing one
+            # cut short (e.g. on deadline expiry) drops it
+            stream.close()
+
+        if answer is None:
+            answer = "".join(deltas)
+        return answer, first_token_at
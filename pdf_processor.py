@@ -1,28 +1,41 @@
 from pdf2image import convert_from_path
+from pdf2image.exceptions import PDFPopplerTimeoutError
 import pytesseract
+from deadline import DeadlineExceeded
 
 
-def pdf_to_images(pdf_path, dpi=300):
+def pdf_to_images(pdf_path, dpi=300, deadline=None):
     """
     Convert PDF to images.
     
     Args:
         pdf_path: Path to PDF file
         dpi: Resolution for conversion
+        deadline: Optional Deadline capping the conversion time
         
     Returns:
         List of PIL Image objects
     """
-    return convert_from_path(pdf_path, dpi=dpi)
+    if deadline is None:
+        return convert_from_path(pdf_path, dpi=dpi)
+    
+    timeout = deadline.timeout(stage="pdf conversion")
+    try:
+        return convert_from_path(pdf_path, dpi=dpi, timeout=timeout)
+    except PDFPopplerTimeoutError as e:
+        if deadline.expired():
+            raise DeadlineExceeded("pdf conversion") from e
+        raise
 
 
-def images_to_text(images, lang="eng"):
+def images_to_text(images, lang="eng", deadline=None):
     """
     Extract text from images using OCR.
     
     Args:
         images: List of PIL Image objects
         lang: Tesseract language code
+        deadline: Optional Deadline capping the OCR time of each page
         
     Returns:
         Concatenated text from all images
@@ -30,13 +43,38 @@ def images_to_text(images, lang="eng"):
     pages_text = []
     
     for img in images:
-        text = pytesseract.image_to_string(img, lang=lang)
+        if deadline is None:
+            text = pytesseract.image_to_string(img, lang=lang)
+        else:
+            text = _image_to_string_within(img, lang, deadline)
         pages_text.append(text)
     
     return "\n".join(pages_text)
 
 
-def extract_text_from_pdf(pdf_path, dpi=300, lang="eng"):
+def _image_to_string_within(img, lang, deadline):
+    """
+    OCR a single image, limited to the remaining job budget.
+    
+    Args:
+        img: PIL Image object
+        lang: Tesseract language code
+        deadline: Deadline capping the OCR time
+        
+    Returns:
+        Text extracted from the image
+    """
+    timeout = deadline.timeout(stage="ocr")
+    try:
+        return pytesseract.image_to_string(img, lang=lang, timeout=timeout)
+    except RuntimeError as e:
+        # pytesseract signals a killed process with a plain RuntimeError
+        if deadline.expired():
+            raise DeadlineExceeded("ocr") from e
+        raise
+
+
+def extract_text_from_pdf(pdf_path, dpi=300, lang="eng", deadline=None):
     """
     Extract text from a PDF using OCR.
     
@@ -44,10 +82,14 @@ def extract_text_from_pdf(pdf_path, dpi=300, lang="eng"):
         pdf_path: Path to PDF file
         dpi: Resolution for conversion
         lang: Tesseract language code
+        deadline: Optional Deadline capping conversion and OCR time
         
     Returns:
         Extracted text string
+        
+    Raises:
+        DeadlineExceeded: If the job budget runs out
     """
-    images = pdf_to_images(pdf_path, dpi=dpi)
-    text = images_to_text(images, lang=lang)
+    images = pdf_to_images(pdf_path, dpi=dpi, deadline=deadline)
+    text = images_to_text(images, lang=lang, deadline=deadline)
     return text
\ No newline at end of file